@@ -73,6 +73,9 @@ Network
     network_adjacency_matrix
     network_connectivity_matrix
     network_degree_matrix
+    network_edge_lengths_numpy
+    network_edge_midpoints_numpy
+    network_edge_vectors_numpy
     network_laplacian_matrix
 
 
@@ -317,6 +320,9 @@ if not compas.IPY:
         network_adjacency_matrix,
         network_connectivity_matrix,
         network_degree_matrix,
+        network_edge_lengths_numpy,
+        network_edge_midpoints_numpy,
+        network_edge_vectors_numpy,
         network_laplacian_matrix,
     )
     from .mesh import (
@@ -462,6 +468,9 @@ if not compas.IPY:
         'network_adjacency_matrix',
         'network_connectivity_matrix',
         'network_degree_matrix',
+        'network_edge_lengths_numpy',
+        'network_edge_midpoints_numpy',
+        'network_edge_vectors_numpy',
         'network_laplacian_matrix',
         # Meshes
         'mesh_adjacency_matrix',
@@ -123,24 +123,24 @@ class Graph(Datastructure):
         self.default_node_attributes.update(default_node_attributes)
         self.default_edge_attributes.update(default_edge_attributes)
         # add the nodes
-        self.node = {literal_eval(key): attr for key, attr in iter(node.items())}
+        self.node = {literal_eval(key): attr for key, attr in node.items()}
         # add the edges
         self.edge = {}
-        for u, nbrs in iter(edge.items()):
+        for u, nbrs in edge.items():
             nbrs = nbrs or {}
             u = literal_eval(u)
             self.edge[u] = {}
-            for v, attr in iter(nbrs.items()):
+            for v, attr in nbrs.items():
                 attr = attr or {}
                 v = literal_eval(v)
                 self.edge[u][v] = attr
         # add the adjacency
         self.adjacency = {}
-        for u, nbrs in iter(adjacency.items()):
+        for u, nbrs in adjacency.items():
             nbrs = nbrs or {}
             u = literal_eval(u)
             self.adjacency[u] = {}
-            for v, _ in iter(nbrs.items()):
+            for v, _ in nbrs.items():
                 v = literal_eval(v)
                 self.adjacency[u][v] = None
 
@@ -453,9 +453,11 @@ class Graph(Datastructure):
             self.node[key] = {}
             self.edge[key] = {}
             self.adjacency[key] = {}
-        attr = attr_dict or {}
-        attr.update(kwattr)
-        self.node[key].update(attr)
+        attr = self.node[key]
+        if attr_dict:
+            attr.update(attr_dict)
+        if kwattr:
+            attr.update(kwattr)
         return key
 
     def add_edge(self, u, v, attr_dict=None, **kwattr):
@@ -482,19 +484,17 @@ class Graph(Datastructure):
         >>>
 
         """
-        attr = attr_dict or {}
-        attr.update(kwattr)
         if u not in self.node:
             u = self.add_node(u)
         if v not in self.node:
             v = self.add_node(v)
-        data = self.edge[u].get(v, {})
-        data.update(attr)
-        self.edge[u][v] = data
-        if v not in self.adjacency[u]:
-            self.adjacency[u][v] = None
-        if u not in self.adjacency[v]:
-            self.adjacency[v][u] = None
+        data = self.edge[u].setdefault(v, {})
+        if attr_dict:
+            data.update(attr_dict)
+        if kwattr:
+            data.update(kwattr)
+        self.adjacency[u][v] = None
+        self.adjacency[v][u] = None
         return u, v
 
     # --------------------------------------------------------------------------
@@ -736,8 +736,8 @@ class Graph(Datastructure):
             If `data` is True, the next edge identifier and its attributes as a ((u, v), attr) tuple.
 
         """
-        for u, nbrs in iter(self.edge.items()):
-            for v, attr in iter(nbrs.items()):
+        for u, nbrs in self.edge.items():
+            for v, attr in nbrs.items():
                 if data:
                     yield (u, v), attr
                 else:
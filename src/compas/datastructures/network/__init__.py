@@ -8,6 +8,7 @@ from .operations import *  # noqa: F401 F403
 
 if not compas.IPY:
     from .matrices import *  # noqa: F401 F403
+    from .geometry_numpy import *  # noqa: F401 F403
 
 from .network import *  # noqa: F401 F403
 
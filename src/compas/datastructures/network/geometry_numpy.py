@@ -0,0 +1,98 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import asarray
+from numpy import einsum
+from numpy import sqrt
+
+
+__all__ = [
+    'network_edge_lengths_numpy',
+    'network_edge_vectors_numpy',
+    'network_edge_midpoints_numpy',
+]
+
+
+def _network_edge_points_numpy(network):
+    xyz, edges = network.to_nodes_and_edges()
+    xyz = asarray(xyz, dtype=float).reshape((-1, 3))
+    edges = asarray(edges, dtype=int).reshape((-1, 2))
+    return xyz[edges[:, 0]], xyz[edges[:, 1]]
+
+
+def network_edge_lengths_numpy(network):
+    """Compute the lengths of all edges of a network.
+
+    Parameters
+    ----------
+    network : :class:`~compas.datastructures.Network`
+        A network object.
+
+    Returns
+    -------
+    array
+        The edge lengths, in the order of :meth:`~compas.datastructures.Network.edges`.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Network
+    >>> network = Network.from_nodes_and_edges([[0, 0, 0], [3, 4, 0]], [(0, 1)])
+    >>> network_edge_lengths_numpy(network).tolist()
+    [5.0]
+
+    """
+    a, b = _network_edge_points_numpy(network)
+    ab = b - a
+    return sqrt(einsum('ij,ij->i', ab, ab))
+
+
+def network_edge_vectors_numpy(network):
+    """Compute the vectors of all edges of a network.
+
+    Parameters
+    ----------
+    network : :class:`~compas.datastructures.Network`
+        A network object.
+
+    Returns
+    -------
+    array
+        The edge vectors, from start to end node,
+        in the order of :meth:`~compas.datastructures.Network.edges`.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Network
+    >>> network = Network.from_nodes_and_edges([[0, 0, 0], [3, 4, 0]], [(0, 1)])
+    >>> network_edge_vectors_numpy(network).tolist()
+    [[3.0, 4.0, 0.0]]
+
+    """
+    a, b = _network_edge_points_numpy(network)
+    return b - a
+
+
+def network_edge_midpoints_numpy(network):
+    """Compute the midpoints of all edges of a network.
+
+    Parameters
+    ----------
+    network : :class:`~compas.datastructures.Network`
+        A network object.
+
+    Returns
+    -------
+    array
+        The edge midpoints, in the order of :meth:`~compas.datastructures.Network.edges`.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Network
+    >>> network = Network.from_nodes_and_edges([[0, 0, 0], [3, 4, 0]], [(0, 1)])
+    >>> network_edge_midpoints_numpy(network).tolist()
+    [[1.5, 2.0, 0.0]]
+
+    """
+    a, b = _network_edge_points_numpy(network)
+    return 0.5 * (a + b)
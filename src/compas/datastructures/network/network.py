@@ -2,6 +2,8 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+from math import sqrt
+
 import compas
 
 if compas.PY2:
@@ -12,11 +14,8 @@ else:
 from compas.files import OBJ
 
 from compas.utilities import geometric_key
-from compas.geometry import centroid_points
 from compas.geometry import subtract_vectors
-from compas.geometry import distance_point_point
 from compas.geometry import midpoint_line
-from compas.geometry import normalize_vector
 from compas.geometry import add_vectors
 from compas.geometry import scale_vector
 
@@ -129,14 +128,14 @@ class Network(Graph):
 
         """
         network = cls()
+        add_node = network.add_node
+        add_edge = network.add_edge
         obj = OBJ(filepath, precision)
         obj.read()
-        nodes = obj.vertices
-        edges = obj.lines
-        for i, (x, y, z) in enumerate(nodes):
-            network.add_node(i, x=x, y=y, z=z)
-        for u, v in edges:
-            network.add_edge(u, v)
+        for i, (x, y, z) in enumerate(obj.vertices):
+            add_node(i, x=x, y=y, z=z)
+        for u, v in obj.lines:
+            add_edge(u, v)
         return network
 
     @classmethod
@@ -157,23 +156,21 @@ class Network(Graph):
 
         """
         network = cls()
-        edges = []
+        gkey_index = {}
         node = {}
+        edges = []
         for line in lines:
             sp = line[0]
             ep = line[1]
-            a = geometric_key(sp, precision)
-            b = geometric_key(ep, precision)
-            node[a] = sp
-            node[b] = ep
-            edges.append((a, b))
-        key_index = dict((k, i) for i, k in enumerate(iter(node)))
-        for key, xyz in iter(node.items()):
-            i = key_index[key]
+            i = gkey_index.setdefault(geometric_key(sp, precision), len(gkey_index))
+            j = gkey_index.setdefault(geometric_key(ep, precision), len(gkey_index))
+            node[i] = sp
+            node[j] = ep
+            edges.append((i, j))
+        for i in range(len(gkey_index)):
+            xyz = node[i]
             network.add_node(i, x=xyz[0], y=xyz[1], z=xyz[2])
-        for u, v in edges:
-            i = key_index[u]
-            j = key_index[v]
+        for i, j in edges:
             network.add_edge(i, j)
         return network
 
@@ -194,16 +191,18 @@ class Network(Graph):
 
         """
         network = cls()
+        add_node = network.add_node
+        add_edge = network.add_edge
 
         if isinstance(nodes, Mapping):
             for key, (x, y, z) in nodes.items():
-                network.add_node(key, x=x, y=y, z=z)
+                add_node(key, x=x, y=y, z=z)
         else:
             for i, (x, y, z) in enumerate(nodes):
-                network.add_node(i, x=x, y=y, z=z)
+                add_node(i, x=x, y=y, z=z)
 
         for u, v in edges:
-            network.add_edge(u, v)
+            add_edge(u, v)
 
         return network
 
@@ -260,7 +259,7 @@ class Network(Graph):
             A list with the coordinates of the vertices of the network.
 
         """
-        return [self.node_coordinates(key) for key in self.nodes()]
+        return [[attr['x'], attr['y'], attr['z']] for attr in self.node.values()]
 
     def to_lines(self):
         """Return the lines of the network as pairs of start and end point coordinates.
@@ -271,7 +270,13 @@ class Network(Graph):
             A list of lines each defined by a pair of point coordinates.
 
         """
-        return [self.edge_coordinates(u, v) for u, v in self.edges()]
+        node = self.node
+        lines = []
+        for u, v in self.edges():
+            a = node[u]
+            b = node[v]
+            lines.append(([a['x'], a['y'], a['z']], [b['x'], b['y'], b['z']]))
+        return lines
 
     def to_nodes_and_edges(self):
         """Return the nodes and edges of a network.
@@ -284,8 +289,11 @@ class Network(Graph):
             A list of edges, with each edge represented by a pair of indices in the node list.
 
         """
-        key_index = dict((key, index) for index, key in enumerate(self.nodes()))
-        nodes = [self.node_coordinates(key) for key in self.nodes()]
+        key_index = {}
+        nodes = []
+        for index, (key, attr) in enumerate(self.node.items()):
+            key_index[key] = index
+            nodes.append([attr['x'], attr['y'], attr['z']])
         edges = [(key_index[u], key_index[v]) for u, v in self.edges()]
         return nodes, edges
 
@@ -309,8 +317,7 @@ class Network(Graph):
 
         """
         gkey = geometric_key
-        xyz = self.node_coordinates
-        return {key: gkey(xyz(key), precision) for key in self.nodes()}
+        return {key: gkey((attr['x'], attr['y'], attr['z']), precision) for key, attr in self.node.items()}
 
     def gkey_key(self, precision=None):
         """Returns a dictionary that maps *geometric keys* of a certain precision
@@ -328,8 +335,7 @@ class Network(Graph):
 
         """
         gkey = geometric_key
-        xyz = self.node_coordinates
-        return {gkey(xyz(key), precision): key for key in self.nodes()}
+        return {gkey((attr['x'], attr['y'], attr['z']), precision): key for key, attr in self.node.items()}
 
     node_gkey = key_gkey
     gkey_node = gkey_key
@@ -386,7 +392,10 @@ class Network(Graph):
             The coordinates of the node.
 
         """
-        return [self.node[key][axis] for axis in axes]
+        attr = self.node[key]
+        if axes == 'xyz':
+            return [attr['x'], attr['y'], attr['z']]
+        return [attr[axis] for axis in axes]
 
     def node_laplacian(self, key):
         """Return the vector from the node to the centroid of its 1-ring neighborhood.
@@ -402,9 +411,9 @@ class Network(Graph):
             The laplacian vector.
 
         """
-        c = centroid_points([self.node_coordinates(nbr) for nbr in self.neighbors(key)])
-        p = self.node_coordinates(key)
-        return subtract_vectors(c, p)
+        x, y, z = self.node_neighborhood_centroid(key)
+        attr = self.node[key]
+        return [x - attr['x'], y - attr['y'], z - attr['z']]
 
     def node_neighborhood_centroid(self, key):
         """Compute the centroid of the neighboring nodes.
@@ -420,7 +429,16 @@ class Network(Graph):
             The coordinates of the centroid.
 
         """
-        return centroid_points([self.node_coordinates(nbr) for nbr in self.neighbors(key)])
+        node = self.node
+        nbrs = self.neighbors(key)
+        x = y = z = 0.0
+        for nbr in nbrs:
+            attr = node[nbr]
+            x += attr['x']
+            y += attr['y']
+            z += attr['z']
+        n = len(nbrs)
+        return [x / n, y / n, z / n]
 
     # --------------------------------------------------------------------------
     # edge geometry
@@ -446,7 +464,11 @@ class Network(Graph):
             The coordinates of the end point.
 
         """
-        return self.node_coordinates(u, axes=axes), self.node_coordinates(v, axes=axes)
+        a = self.node[u]
+        b = self.node[v]
+        if axes == 'xyz':
+            return [a['x'], a['y'], a['z']], [b['x'], b['y'], b['z']]
+        return [a[axis] for axis in axes], [b[axis] for axis in axes]
 
     def edge_length(self, u, v):
         """Return the length of an edge.
@@ -464,8 +486,12 @@ class Network(Graph):
             The length of the edge.
 
         """
-        a, b = self.edge_coordinates(u, v)
-        return distance_point_point(a, b)
+        a = self.node[u]
+        b = self.node[v]
+        dx = b['x'] - a['x']
+        dy = b['y'] - a['y']
+        dz = b['z'] - a['z']
+        return sqrt(dx * dx + dy * dy + dz * dz)
 
     def edge_vector(self, u, v):
         """Return the vector of an edge.
@@ -546,4 +572,12 @@ class Network(Graph):
             The direction vector of the edge.
 
         """
-        return normalize_vector(self.edge_vector(u, v))
+        a = self.node[u]
+        b = self.node[v]
+        dx = b['x'] - a['x']
+        dy = b['y'] - a['y']
+        dz = b['z'] - a['z']
+        length = sqrt(dx * dx + dy * dy + dz * dz)
+        if not length:
+            return [dx, dy, dz]
+        return [dx / length, dy / length, dz / length]
@@ -2,8 +2,6 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from compas.geometry import centroid_points
-
 
 __all__ = [
     'network_smooth_centroid',
@@ -45,20 +43,30 @@ def network_smooth_centroid(network, fixed=None, kmax=100, damping=0.5, callback
     fixed = fixed or []
     fixed = set(fixed)
 
+    node = network.node
+    neighbors = network.neighbors
+
     for k in range(kmax):
-        key_xyz = {key: network.node_coordinates(key) for key in network.nodes()}
+        key_xyz = {key: [attr['x'], attr['y'], attr['z']] for key, attr in node.items()}
 
-        for key, attr in network.nodes(True):
+        for key, attr in node.items():
             if key in fixed:
                 continue
 
             x, y, z = key_xyz[key]
 
-            cx, cy, cz = centroid_points([key_xyz[nbr] for nbr in network.neighbors(key)])
-
-            attr['x'] += damping * (cx - x)
-            attr['y'] += damping * (cy - y)
-            attr['z'] += damping * (cz - z)
+            nbrs = neighbors(key)
+            cx = cy = cz = 0.0
+            for nbr in nbrs:
+                nx, ny, nz = key_xyz[nbr]
+                cx += nx
+                cy += ny
+                cz += nz
+            n = len(nbrs)
+
+            attr['x'] += damping * (cx / n - x)
+            attr['y'] += damping * (cy / n - y)
+            attr['z'] += damping * (cz / n - z)
 
         if callback:
             callback(k, callback_args)
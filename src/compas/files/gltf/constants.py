@@ -17,6 +17,13 @@ TYPE_MAT2 = "MAT2"
 TYPE_MAT3 = "MAT3"
 TYPE_MAT4 = "MAT4"
 
+ALPHA_MODE_BLEND = "BLEND"
+ALPHA_MODE_MASK = "MASK"
+ALPHA_MODE_OPAQUE = "OPAQUE"
+
+MIME_TYPE_JPEG = "image/jpeg"
+MIME_TYPE_PNG = "image/png"
+
 COMPONENT_TYPE_ENUM = {
     COMPONENT_TYPE_BYTE: "b",
     COMPONENT_TYPE_UNSIGNED_BYTE: "B",
@@ -2,54 +2,98 @@ from __future__ import print_function
 from __future__ import division
 from __future__ import absolute_import
 
+from compas.files.gltf.constants import ALPHA_MODE_BLEND
+from compas.files.gltf.constants import ALPHA_MODE_MASK
+from compas.files.gltf.constants import ALPHA_MODE_OPAQUE
+from compas.files.gltf.constants import MIME_TYPE_JPEG
+from compas.files.gltf.constants import MIME_TYPE_PNG
+
+
+_SUPPORTED_EXTENSIONS = None
+
+
+def _get_supported_extensions():
+    # the extensions module imports this module, so it can only be imported once both are loaded
+    global _SUPPORTED_EXTENSIONS
+    if _SUPPORTED_EXTENSIONS is None:
+        from compas.files.gltf.extensions import SUPPORTED_EXTENSIONS
+
+        _SUPPORTED_EXTENSIONS = SUPPORTED_EXTENSIONS
+    return _SUPPORTED_EXTENSIONS
+
 
 class AlphaMode(object):
-    BLEND = "BLEND"
-    MASK = "MASK"
-    OPAQUE = "OPAQUE"
+    BLEND = ALPHA_MODE_BLEND
+    MASK = ALPHA_MODE_MASK
+    OPAQUE = ALPHA_MODE_OPAQUE
 
 
 class MineType(object):
-    JPEG = "image/jpeg"
-    PNG = "image/png"
+    JPEG = MIME_TYPE_JPEG
+    PNG = MIME_TYPE_PNG
 
 
 # I changed the name of this so as not to collide with compas.Base
 class BaseGLTFDataClass(object):
+    __slots__ = ['extras', 'extensions']
 
-    IS_BASE_GLTF_DATA = True  # only needed for ipy in `GLTFContent.check_extensions_texture_recursively`
+    IS_BASE_GLTF_DATA = True  # only needed for ipy in `GLTFContent.remove_orphans` and `extensions_to_data`
+
+    # pairs of glTF keys and attribute names of the values that are written as-is if they are not None
+    DATA_FIELDS = ()
 
     def __init__(self, extras=None, extensions=None):
         self.extras = extras
         self.extensions = extensions
 
+    def __getstate__(self):
+        """Return the attribute values for state serialization with older pickle protocols."""
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        """Assign deserialized attribute values to support older pickle protocols."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def fields_to_data(self):
+        dct = {}
+        for key, name in self.DATA_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                dct[key] = value
+        return dct
+
     def add_extension(self, extension):
         if not self.extensions:
             self.extensions = {}
-        self.extensions.update({extension.key: extension})
+        self.extensions[extension.key] = extension
 
     def extensions_to_data(self, **kwargs):
         if not self.extensions:
             return None
-        return {key: value.to_data(**kwargs) if hasattr(value, "to_data") else value for key, value in self.extensions.items()}
+        return {key: value.to_data(**kwargs) if getattr(value, "IS_BASE_GLTF_DATA", False) else value for key, value in self.extensions.items()}
 
     @classmethod
     def extensions_from_data(cls, data):
-        # i hate hate hate this local import, but i don't see a good way around it
-        from compas.files.gltf.extensions import SUPPORTED_EXTENSIONS
-
         if not data:
             return None
+        supported_extensions = _get_supported_extensions()
         extensions = {}
         for key, value_data in data.items():
-            if key in SUPPORTED_EXTENSIONS:
-                extensions[key] = SUPPORTED_EXTENSIONS[key].from_data(value_data)
+            extension = supported_extensions.get(key)
+            if extension is not None:
+                extensions[key] = extension.from_data(value_data)
             else:
                 extensions[key] = value_data
         return extensions
 
     def to_data(self, *args, **kwargs):
-        dct = {}
+        dct = self.fields_to_data()
         if self.extras is not None:
             dct["extras"] = self.extras
         if self.extensions is not None:
@@ -58,6 +102,16 @@ class BaseGLTFDataClass(object):
 
 
 class SamplerData(BaseGLTFDataClass):
+    __slots__ = ['mag_filter', 'min_filter', 'wrap_s', 'wrap_t', 'name']
+
+    DATA_FIELDS = (
+        ("magFilter", "mag_filter"),
+        ("minFilter", "min_filter"),
+        ("wrapS", "wrap_s"),
+        ("wrapT", "wrap_t"),
+        ("name", "name"),
+    )
+
     def __init__(
         self,
         mag_filter=None,
@@ -76,17 +130,7 @@ class SamplerData(BaseGLTFDataClass):
         self.name = name
 
     def to_data(self):
-        sampler_dict = {}
-        if self.mag_filter is not None:
-            sampler_dict["magFilter"] = self.mag_filter
-        if self.min_filter is not None:
-            sampler_dict["minFilter"] = self.min_filter
-        if self.wrap_s is not None:
-            sampler_dict["wrapS"] = self.wrap_s
-        if self.wrap_t is not None:
-            sampler_dict["wrapT"] = self.wrap_t
-        if self.name is not None:
-            sampler_dict["name"] = self.name
+        sampler_dict = self.fields_to_data()
         if self.extras is not None:
             sampler_dict["extras"] = self.extras
         if self.extensions is not None:
@@ -97,18 +141,23 @@ class SamplerData(BaseGLTFDataClass):
     def from_data(cls, sampler):
         if sampler is None:
             return None
+        get = sampler.get
         return cls(
-            mag_filter=sampler.get("magFilter"),
-            min_filter=sampler.get("minFilter"),
-            wrap_s=sampler.get("wrapS"),
-            wrap_t=sampler.get("wrapT"),
-            name=sampler.get("name"),
-            extras=sampler.get("extras"),
-            extensions=cls.extensions_from_data(sampler.get("extensions")),
+            mag_filter=get("magFilter"),
+            min_filter=get("minFilter"),
+            wrap_s=get("wrapS"),
+            wrap_t=get("wrapT"),
+            name=get("name"),
+            extras=get("extras"),
+            extensions=cls.extensions_from_data(get("extensions")),
         )
 
 
 class TextureData(BaseGLTFDataClass):
+    __slots__ = ['sampler', 'source', 'name']
+
+    DATA_FIELDS = (("name", "name"),)
+
     def __init__(self, sampler=None, source=None, name=None, extras=None, extensions=None):
         super(TextureData, self).__init__(extras, extensions)
         self.sampler = sampler
@@ -116,13 +165,11 @@ class TextureData(BaseGLTFDataClass):
         self.name = name
 
     def to_data(self, sampler_index_by_key, image_index_by_key):
-        texture_dict = {}
+        texture_dict = self.fields_to_data()
         if self.sampler is not None:
             texture_dict["sampler"] = sampler_index_by_key[self.sampler]
         if self.source is not None:
             texture_dict["source"] = image_index_by_key[self.source]
-        if self.name is not None:
-            texture_dict["name"] = self.name
         if self.extras is not None:
             texture_dict["extras"] = self.extras
         if self.extensions is not None:
@@ -133,18 +180,22 @@ class TextureData(BaseGLTFDataClass):
     def from_data(cls, texture):
         if texture is None:
             return None
+        get = texture.get
         return cls(
-            sampler=texture.get("sampler"),
-            source=texture.get("source"),
-            name=texture.get("name"),
-            extras=texture.get("extras"),
-            extensions=cls.extensions_from_data(texture.get("extensions")),
+            sampler=get("sampler"),
+            source=get("source"),
+            name=get("name"),
+            extras=get("extras"),
+            extensions=cls.extensions_from_data(get("extensions")),
         )
 
 
 class TextureInfoData(BaseGLTFDataClass):
+    __slots__ = ['index', 'tex_coord']
+
+    IS_TEXTURE_INFO_DATA = True  # only needed for ipy in `GLTFContent.remove_orphans`
 
-    IS_TEXTURE_INFO_DATA = True  # only needed for ipy in `GLTFContent.check_extensions_texture_recursively`
+    DATA_FIELDS = (("texCoord", "tex_coord"),)
 
     def __init__(self, index, tex_coord=None, extras=None, extensions=None):
         super(TextureInfoData, self).__init__(extras, extensions)
@@ -152,9 +203,8 @@ class TextureInfoData(BaseGLTFDataClass):
         self.tex_coord = tex_coord
 
     def to_data(self, texture_index_by_key):
-        texture_info_dict = {"index": texture_index_by_key[self.index]}
-        if self.tex_coord is not None:
-            texture_info_dict["texCoord"] = self.tex_coord
+        texture_info_dict = self.fields_to_data()
+        texture_info_dict["index"] = texture_index_by_key[self.index]
         if self.extras is not None:
             texture_info_dict["extras"] = self.extras
         if self.extensions is not None:
@@ -165,63 +215,70 @@ class TextureInfoData(BaseGLTFDataClass):
     def from_data(cls, texture_info):
         if texture_info is None:
             return None
+        get = texture_info.get
         return cls(
             index=texture_info["index"],
-            tex_coord=texture_info.get("texCoord"),
-            extras=texture_info.get("extras"),
-            extensions=cls.extensions_from_data(texture_info.get("extensions")),
+            tex_coord=get("texCoord"),
+            extras=get("extras"),
+            extensions=cls.extensions_from_data(get("extensions")),
         )
 
 
 class OcclusionTextureInfoData(TextureInfoData):
+    __slots__ = ['strength']
+
+    DATA_FIELDS = TextureInfoData.DATA_FIELDS + (("strength", "strength"),)
+
     def __init__(self, index, tex_coord=None, extras=None, extensions=None, strength=None):
         super(OcclusionTextureInfoData, self).__init__(index, tex_coord, extras, extensions)
         self.strength = strength
 
-    def to_data(self, texture_index_by_key):
-        texture_info_dict = super(OcclusionTextureInfoData, self).to_data(texture_index_by_key)
-        if self.strength is not None:
-            texture_info_dict["strength"] = self.strength
-        return texture_info_dict
-
     @classmethod
     def from_data(cls, texture_info):
         if texture_info is None:
             return None
+        get = texture_info.get
         return cls(
             index=texture_info["index"],
-            tex_coord=texture_info.get("texCoord"),
-            extras=texture_info.get("extras"),
-            extensions=cls.extensions_from_data(texture_info.get("extensions")),
-            strength=texture_info.get("strength"),
+            tex_coord=get("texCoord"),
+            extras=get("extras"),
+            extensions=cls.extensions_from_data(get("extensions")),
+            strength=get("strength"),
         )
 
 
 class NormalTextureInfoData(TextureInfoData):
+    __slots__ = ['scale']
+
+    DATA_FIELDS = TextureInfoData.DATA_FIELDS + (("scale", "scale"),)
+
     def __init__(self, index, tex_coord=None, extras=None, extensions=None, scale=None):
         super(NormalTextureInfoData, self).__init__(index, tex_coord, extras, extensions)
         self.scale = scale
 
-    def to_data(self, texture_index_by_key):
-        texture_info_dict = super(NormalTextureInfoData, self).to_data(texture_index_by_key)
-        if self.scale is not None:
-            texture_info_dict["scale"] = self.scale
-        return texture_info_dict
-
     @classmethod
     def from_data(cls, texture_info):
         if texture_info is None:
             return None
+        get = texture_info.get
         return cls(
             index=texture_info["index"],
-            tex_coord=texture_info.get("texCoord"),
-            extras=texture_info.get("extras"),
-            extensions=cls.extensions_from_data(texture_info.get("extensions")),
-            scale=texture_info.get("scale"),
+            tex_coord=get("texCoord"),
+            extras=get("extras"),
+            extensions=cls.extensions_from_data(get("extensions")),
+            scale=get("scale"),
         )
 
 
 class PBRMetallicRoughnessData(BaseGLTFDataClass):
+    __slots__ = ['base_color_factor', 'base_color_texture', 'metallic_factor', 'roughness_factor', 'metallic_roughness_texture']
+
+    DATA_FIELDS = (
+        ("baseColorFactor", "base_color_factor"),
+        ("metallicFactor", "metallic_factor"),
+        ("roughnessFactor", "roughness_factor"),
+    )
+
     def __init__(
         self,
         base_color_factor=None,
@@ -240,15 +297,9 @@ class PBRMetallicRoughnessData(BaseGLTFDataClass):
         self.metallic_roughness_texture = metallic_roughness_texture
 
     def to_data(self, texture_index_by_key):
-        roughness_dict = {}
-        if self.base_color_factor is not None:
-            roughness_dict["baseColorFactor"] = self.base_color_factor
+        roughness_dict = self.fields_to_data()
         if self.base_color_texture is not None:
             roughness_dict["baseColorTexture"] = self.base_color_texture.to_data(texture_index_by_key)
-        if self.metallic_factor is not None:
-            roughness_dict["metallicFactor"] = self.metallic_factor
-        if self.roughness_factor is not None:
-            roughness_dict["roughnessFactor"] = self.roughness_factor
         if self.metallic_roughness_texture is not None:
             roughness_dict["metallicRoughnessTexture"] = self.metallic_roughness_texture.to_data(texture_index_by_key)
         if self.extras is not None:
@@ -261,18 +312,29 @@ class PBRMetallicRoughnessData(BaseGLTFDataClass):
     def from_data(cls, texture_info):
         if texture_info is None:
             return None
+        get = texture_info.get
         return cls(
-            base_color_factor=texture_info.get("baseColorFactor"),
-            base_color_texture=TextureInfoData.from_data(texture_info.get("baseColorTexture")),
-            metallic_factor=texture_info.get("metallicFactor"),
-            roughness_factor=texture_info.get("roughnessFactor"),
-            metallic_roughness_texture=TextureInfoData.from_data(texture_info.get("metallicRoughnessTexture")),
-            extras=texture_info.get("extras"),
-            extensions=cls.extensions_from_data(texture_info.get("extensions")),
+            base_color_factor=get("baseColorFactor"),
+            base_color_texture=TextureInfoData.from_data(get("baseColorTexture")),
+            metallic_factor=get("metallicFactor"),
+            roughness_factor=get("roughnessFactor"),
+            metallic_roughness_texture=TextureInfoData.from_data(get("metallicRoughnessTexture")),
+            extras=get("extras"),
+            extensions=cls.extensions_from_data(get("extensions")),
         )
 
 
 class MaterialData(BaseGLTFDataClass):
+    __slots__ = ['name', 'pbr_metallic_roughness', 'normal_texture', 'occlusion_texture', 'emissive_texture', 'emissive_factor', 'alpha_mode', 'alpha_cutoff', 'double_sided']
+
+    DATA_FIELDS = (
+        ("name", "name"),
+        ("emissiveFactor", "emissive_factor"),
+        ("alphaMode", "alpha_mode"),
+        ("alphaFactor", "alpha_cutoff"),
+        ("doubleSided", "double_sided"),
+    )
+
     def __init__(
         self,
         name=None,
@@ -299,9 +361,7 @@ class MaterialData(BaseGLTFDataClass):
         self.double_sided = double_sided
 
     def to_data(self, texture_index_by_key):
-        material_dict = {}
-        if self.name is not None:
-            material_dict["name"] = self.name
+        material_dict = self.fields_to_data()
         if self.extras is not None:
             material_dict["extras"] = self.extras
         if self.pbr_metallic_roughness is not None:
@@ -312,14 +372,6 @@ class MaterialData(BaseGLTFDataClass):
             material_dict["materialTexture"] = self.occlusion_texture.to_data(texture_index_by_key)
         if self.emissive_texture is not None:
             material_dict["emissiveTexture"] = self.emissive_texture.to_data(texture_index_by_key)
-        if self.emissive_factor is not None:
-            material_dict["emissiveFactor"] = self.emissive_factor
-        if self.alpha_mode is not None:
-            material_dict["alphaMode"] = self.alpha_mode
-        if self.alpha_cutoff is not None:
-            material_dict["alphaFactor"] = self.alpha_cutoff
-        if self.double_sided is not None:
-            material_dict["doubleSided"] = self.double_sided
         if self.extensions is not None:
             material_dict["extensions"] = self.extensions_to_data(texture_index_by_key=texture_index_by_key)
         return material_dict
@@ -328,22 +380,31 @@ class MaterialData(BaseGLTFDataClass):
     def from_data(cls, material):
         if material is None:
             return None
+        get = material.get
         return cls(
-            name=material.get("name"),
-            extras=material.get("extras"),
-            pbr_metallic_roughness=PBRMetallicRoughnessData.from_data(material.get("pbrMetallicRoughness")),
-            normal_texture=NormalTextureInfoData.from_data(material.get("normalTexture")),
-            occlusion_texture=OcclusionTextureInfoData.from_data(material.get("occlusionTexture")),
-            emissive_texture=TextureInfoData.from_data(material.get("emissiveTexture")),
-            emissive_factor=material.get("emissiveFactor"),
-            alpha_mode=material.get("alphaMode"),
-            alpha_cutoff=material.get("alphaCutoff"),
-            double_sided=material.get("doubleSided"),
-            extensions=cls.extensions_from_data(material.get("extensions")),
+            name=get("name"),
+            extras=get("extras"),
+            pbr_metallic_roughness=PBRMetallicRoughnessData.from_data(get("pbrMetallicRoughness")),
+            normal_texture=NormalTextureInfoData.from_data(get("normalTexture")),
+            occlusion_texture=OcclusionTextureInfoData.from_data(get("occlusionTexture")),
+            emissive_texture=TextureInfoData.from_data(get("emissiveTexture")),
+            emissive_factor=get("emissiveFactor"),
+            alpha_mode=get("alphaMode"),
+            alpha_cutoff=get("alphaCutoff"),
+            double_sided=get("doubleSided"),
+            extensions=cls.extensions_from_data(get("extensions")),
         )
 
 
 class CameraData(BaseGLTFDataClass):
+    __slots__ = ['type', 'orthographic', 'perspective', 'name']
+
+    DATA_FIELDS = (
+        ("orthographic", "orthographic"),
+        ("perspective", "perspective"),
+        ("name", "name"),
+    )
+
     def __init__(
         self,
         type_,
@@ -360,13 +421,8 @@ class CameraData(BaseGLTFDataClass):
         self.name = name
 
     def to_data(self):
-        camera_dict = {"type": self.type}
-        if self.orthographic is not None:
-            camera_dict["orthographic"] = self.orthographic
-        if self.perspective is not None:
-            camera_dict["perspective"] = self.perspective
-        if self.name is not None:
-            camera_dict["name"] = self.name
+        camera_dict = self.fields_to_data()
+        camera_dict["type"] = self.type
         if self.extras is not None:
             camera_dict["extras"] = self.extras
         if self.extensions is not None:
@@ -377,17 +433,22 @@ class CameraData(BaseGLTFDataClass):
     def from_data(cls, camera):
         if camera is None:
             return None
+        get = camera.get
         return cls(
             type_=camera["type"],
-            orthographic=camera.get("orthographic"),
-            perspective=camera.get("perspective"),
-            name=camera.get("name"),
-            extras=camera.get("extras"),
-            extensions=cls.extensions_from_data(camera.get("extensions")),
+            orthographic=get("orthographic"),
+            perspective=get("perspective"),
+            name=get("name"),
+            extras=get("extras"),
+            extensions=cls.extensions_from_data(get("extensions")),
         )
 
 
 class AnimationSamplerData(BaseGLTFDataClass):
+    __slots__ = ['input', 'output', 'interpolation']
+
+    DATA_FIELDS = (("interpolation", "interpolation"),)
+
     def __init__(self, input_, output, interpolation=None, extras=None, extensions=None):
         super(AnimationSamplerData, self).__init__(extras, extensions)
         self.input = input_
@@ -395,12 +456,9 @@ class AnimationSamplerData(BaseGLTFDataClass):
         self.interpolation = interpolation
 
     def to_data(self, input_accessor, output_accessor):
-        sampler_dict = {
-            "input": input_accessor,
-            "output": output_accessor,
-        }
-        if self.interpolation is not None:
-            sampler_dict["interpolation"] = self.interpolation
+        sampler_dict = self.fields_to_data()
+        sampler_dict["input"] = input_accessor
+        sampler_dict["output"] = output_accessor
         if self.extras is not None:
             sampler_dict["extras"] = self.extras
         if self.extensions is not None:
@@ -411,16 +469,19 @@ class AnimationSamplerData(BaseGLTFDataClass):
     def from_data(cls, sampler, input_, output):
         if sampler is None:
             return None
+        get = sampler.get
         return cls(
             input_=input_,
             output=output,
-            interpolation=sampler.get("interpolation"),
-            extras=sampler.get("extras"),
-            extensions=cls.extensions_from_data(sampler.get("extensions")),
+            interpolation=get("interpolation"),
+            extras=get("extras"),
+            extensions=cls.extensions_from_data(get("extensions")),
         )
 
 
 class TargetData(BaseGLTFDataClass):
+    __slots__ = ['path', 'node']
+
     def __init__(self, path, node=None, extras=None, extensions=None):
         super(TargetData, self).__init__(extras, extensions)
         self.path = path
@@ -440,15 +501,18 @@ class TargetData(BaseGLTFDataClass):
     def from_data(cls, target):
         if target is None:
             return None
+        get = target.get
         return cls(
             path=target["path"],
-            node=target.get("node"),
-            extras=target.get("extras"),
-            extensions=cls.extensions_from_data(target.get("extensions")),
+            node=get("node"),
+            extras=get("extras"),
+            extensions=cls.extensions_from_data(get("extensions")),
         )
 
 
 class ChannelData(BaseGLTFDataClass):
+    __slots__ = ['sampler', 'target']
+
     def __init__(self, sampler, target, extras=None, extensions=None):
         super(ChannelData, self).__init__(extras, extensions)
         self.sampler = sampler
@@ -478,6 +542,10 @@ class ChannelData(BaseGLTFDataClass):
 
 
 class AnimationData(BaseGLTFDataClass):
+    __slots__ = ['channels', 'samplers_dict', 'name', '_sampler_index_by_key']
+
+    DATA_FIELDS = (("name", "name"),)
+
     def __init__(self, channels, samplers_dict, name=None, extras=None, extensions=None):
         super(AnimationData, self).__init__(extras, extensions)
         self.channels = channels
@@ -488,12 +556,9 @@ class AnimationData(BaseGLTFDataClass):
 
     def to_data(self, samplers_list, node_index_by_key):
         channels = [channel_data.to_data(node_index_by_key, self._sampler_index_by_key) for channel_data in self.channels]
-        animation_dict = {
-            "channels": channels,
-            "samplers": samplers_list,
-        }
-        if self.name is not None:
-            animation_dict["name"] = self.name
+        animation_dict = self.fields_to_data()
+        animation_dict["channels"] = channels
+        animation_dict["samplers"] = samplers_list
         if self.extras is not None:
             animation_dict["extras"] = self.extras
         if self.extensions is not None:
@@ -508,16 +573,24 @@ class AnimationData(BaseGLTFDataClass):
     def from_data(cls, animation, channel_data_list, sampler_dict):
         if animation is None:
             return None
+        get = animation.get
         return cls(
             channels=channel_data_list,
             samplers_dict=sampler_dict,
-            name=animation.get("name"),
-            extras=animation.get("extras"),
-            extensions=cls.extensions_from_data(animation.get("extensions")),
+            name=get("name"),
+            extras=get("extras"),
+            extensions=cls.extensions_from_data(get("extensions")),
         )
 
 
 class SkinData(BaseGLTFDataClass):
+    __slots__ = ['joints', 'inverse_bind_matrices', 'skeleton', 'name']
+
+    DATA_FIELDS = (
+        ("skeleton", "skeleton"),
+        ("name", "name"),
+    )
+
     def __init__(
         self,
         joints,
@@ -534,35 +607,40 @@ class SkinData(BaseGLTFDataClass):
         self.name = name
 
     def to_data(self, node_index_by_key, accessor_index):
-        node_indices = [node_index_by_key.get(item) for item in self.joints if node_index_by_key.get(item) is not None]
-        skin_dict = {"joints": node_indices}
-        if self.skeleton is not None:
-            skin_dict["skeleton"] = self.skeleton
-        if self.name is not None:
-            skin_dict["name"] = self.name
+        node_indices = [index for index in map(node_index_by_key.get, self.joints) if index is not None]
+        skin_dict = self.fields_to_data()
+        skin_dict["joints"] = node_indices
         if self.extras is not None:
             skin_dict["extras"] = self.extras
         if self.inverse_bind_matrices is not None:
             skin_dict["inverseBindMatrices"] = accessor_index
         if self.extensions is not None:
-            skin_dict["extensions"] = self.extensions_from_data()
+            skin_dict["extensions"] = self.extensions_to_data()
         return skin_dict
 
     @classmethod
     def from_data(cls, skin, inverse_bind_matrices):
         if skin is None:
             return None
+        get = skin.get
         return cls(
             joints=skin["joints"],
             inverse_bind_matrices=inverse_bind_matrices,
-            skeleton=skin.get("skeleton"),
-            name=skin.get("name"),
-            extras=skin.get("extras"),
-            extensions=cls.extensions_from_data(skin.get("extensions")),
+            skeleton=get("skeleton"),
+            name=get("name"),
+            extras=get("extras"),
+            extensions=cls.extensions_from_data(get("extensions")),
         )
 
 
 class ImageData(BaseGLTFDataClass):
+    __slots__ = ['uri', 'mime_type', 'name', 'data']
+
+    DATA_FIELDS = (
+        ("name", "name"),
+        ("mimeType", "mime_type"),
+    )
+
     def __init__(
         self,
         data=None,
@@ -579,13 +657,9 @@ class ImageData(BaseGLTFDataClass):
         self.data = data
 
     def to_data(self, uri, buffer_view):
-        image_dict = {}
-        if self.name is not None:
-            image_dict["name"] = self.name
+        image_dict = self.fields_to_data()
         if self.extras is not None:
             image_dict["extras"] = self.extras
-        if self.mime_type is not None:
-            image_dict["mimeType"] = self.mime_type
         if uri is not None:
             image_dict["uri"] = uri
         elif buffer_view is not None:
@@ -593,24 +667,29 @@ class ImageData(BaseGLTFDataClass):
         elif self.uri is not None:
             image_dict["uri"] = self.uri
         if self.extensions is not None:
-            image_dict["extensions"] = self.extensions_from_data()
+            image_dict["extensions"] = self.extensions_to_data()
         return image_dict
 
     @classmethod
     def from_data(cls, image, data, mime_type):
         if image is None:
             return None
+        get = image.get
         return cls(
-            uri=image.get("uri"),
-            mime_type=image.get("mimeType") or mime_type,
-            name=image.get("name"),
-            extras=image.get("extras"),
-            extensions=cls.extensions_from_data(image.get("extensions")),
+            uri=get("uri"),
+            mime_type=get("mimeType") or mime_type,
+            name=get("name"),
+            extras=get("extras"),
+            extensions=cls.extensions_from_data(get("extensions")),
             data=data,
         )
 
 
 class PrimitiveData(BaseGLTFDataClass):
+    __slots__ = ['attributes', 'indices', 'material', 'mode', 'targets']
+
+    DATA_FIELDS = (("mode", "mode"),)
+
     def __init__(
         self,
         attributes,
@@ -629,11 +708,10 @@ class PrimitiveData(BaseGLTFDataClass):
         self.targets = targets
 
     def to_data(self, indices_accessor, attributes_dict, targets_dict, material_index_by_key):
-        primitive_dict = {"indices": indices_accessor}
+        primitive_dict = self.fields_to_data()
+        primitive_dict["indices"] = indices_accessor
         if self.material is not None:
             primitive_dict["material"] = material_index_by_key[self.material]
-        if self.mode is not None:
-            primitive_dict["mode"] = self.mode
         if self.extras is not None:
             primitive_dict["extras"] = self.extras
         if attributes_dict:
@@ -648,12 +726,13 @@ class PrimitiveData(BaseGLTFDataClass):
     def from_data(cls, primitive, attributes, indices, target_list):
         if primitive is None:
             return None
+        get = primitive.get
         return cls(
             attributes=attributes,
             indices=indices,
-            material=primitive.get("material"),
-            mode=primitive.get("mode"),
+            material=get("material"),
+            mode=get("mode"),
             targets=target_list,
-            extras=primitive.get("extras"),
-            extensions=cls.extensions_from_data(primitive.get("extensions")),
+            extras=get("extras"),
+            extensions=cls.extensions_from_data(get("extensions")),
         )
@@ -15,6 +15,8 @@ class KHR_materials_transmission(BaseGLTFDataClass):
 
     key = "KHR_materials_transmission"
 
+    DATA_FIELDS = (("transmissionFactor", "transmission_factor"),)
+
     def __init__(
         self,
         transmission_factor=None,
@@ -27,9 +29,7 @@ class KHR_materials_transmission(BaseGLTFDataClass):
         self.transmission_texture = transmission_texture
 
     def to_data(self, texture_index_by_key, **kwargs):
-        dct = {}
-        if self.transmission_factor is not None:
-            dct["transmissionFactor"] = self.transmission_factor
+        dct = self.fields_to_data()
         if self.transmission_texture is not None:
             dct["transmissionTexture"] = self.transmission_texture.to_data(texture_index_by_key)
         if self.extras is not None:
@@ -58,6 +58,11 @@ class KHR_materials_specular(BaseGLTFDataClass):
 
     key = "KHR_materials_specular"
 
+    DATA_FIELDS = (
+        ("specularFactor", "specular_factor"),
+        ("specularColorFactor", "specular_color_factor"),
+    )
+
     def __init__(
         self,
         specular_factor=None,
@@ -74,13 +79,9 @@ class KHR_materials_specular(BaseGLTFDataClass):
         self.specular_color_texture = specular_color_texture
 
     def to_data(self, texture_index_by_key, **kwargs):
-        dct = {}
-        if self.specular_factor is not None:
-            dct["specularFactor"] = self.specular_factor
+        dct = self.fields_to_data()
         if self.specular_texture is not None:
             dct["specularTexture"] = self.specular_texture.to_data(texture_index_by_key)
-        if self.specular_color_factor is not None:
-            dct["specularColorFactor"] = self.specular_color_factor
         if self.specular_color_texture is not None:
             dct["specularColorTexture"] = self.specular_color_texture.to_data(texture_index_by_key)
         if self.extras is not None:
@@ -111,6 +112,8 @@ class KHR_materials_ior(BaseGLTFDataClass):
 
     key = "KHR_materials_ior"
 
+    DATA_FIELDS = (("ior", "ior"),)
+
     def __init__(
         self,
         ior=None,
@@ -121,9 +124,7 @@ class KHR_materials_ior(BaseGLTFDataClass):
         self.ior = ior
 
     def to_data(self, texture_index_by_key, **kwargs):
-        dct = {}
-        if self.ior is not None:
-            dct["ior"] = self.ior
+        dct = self.fields_to_data()
         if self.extras is not None:
             dct["extras"] = self.extras
         if self.extensions is not None:
@@ -149,6 +150,11 @@ class KHR_materials_clearcoat(BaseGLTFDataClass):
 
     key = "KHR_materials_clearcoat"
 
+    DATA_FIELDS = (
+        ("clearcoatFactor", "clearcoat_factor"),
+        ("clearcoatRoughnessFactor", "clearcoat_roughness_factor"),
+    )
+
     def __init__(
         self,
         clearcoat_factor=None,
@@ -167,13 +173,9 @@ class KHR_materials_clearcoat(BaseGLTFDataClass):
         self.clearcoat_normal_texture = clearcoat_normal_texture
 
     def to_data(self, texture_index_by_key, **kwargs):
-        dct = {}
-        if self.clearcoat_factor is not None:
-            dct["clearcoatFactor"] = self.clearcoat_factor
+        dct = self.fields_to_data()
         if self.clearcoat_texture is not None:
             dct["clearcoatTexture"] = self.clearcoat_texture.to_data(texture_index_by_key)
-        if self.clearcoat_roughness_factor is not None:
-            dct["clearcoatRoughnessFactor"] = self.clearcoat_roughness_factor
         if self.clearcoat_roughness_texture is not None:
             dct["clearcoatRoughnessTexture"] = self.clearcoat_roughness_texture.to_data(texture_index_by_key)
         if self.clearcoat_normal_texture is not None:
@@ -207,6 +209,13 @@ class KHR_Texture_Transform(BaseGLTFDataClass):
 
     key = "KHR_texture_transform"
 
+    DATA_FIELDS = (
+        ("offset", "offset"),
+        ("rotation", "rotation"),
+        ("scale", "scale"),
+        ("texCoord", "tex_coord"),
+    )
+
     def __init__(
         self,
         offset=None,
@@ -223,15 +232,7 @@ class KHR_Texture_Transform(BaseGLTFDataClass):
         self.tex_coord = tex_coord
 
     def to_data(self, **kwargs):
-        dct = {}
-        if self.offset is not None:
-            dct["offset"] = self.offset
-        if self.rotation is not None:
-            dct["rotation"] = self.rotation
-        if self.scale is not None:
-            dct["scale"] = self.scale
-        if self.tex_coord is not None:
-            dct["texCoord"] = self.tex_coord
+        dct = self.fields_to_data()
         if self.extras is not None:
             dct["extras"] = self.extras
         if self.extensions is not None:
@@ -257,6 +258,12 @@ class KHR_materials_pbrSpecularGlossiness(BaseGLTFDataClass):
 
     key = "KHR_materials_pbrSpecularGlossiness"
 
+    DATA_FIELDS = (
+        ("diffuseFactor", "diffuse_factor"),
+        ("specularFactor", "specular_factor"),
+        ("glossinessFactor", "glossiness_factor"),
+    )
+
     def __init__(
         self,
         diffuse_factor=None,
@@ -275,15 +282,9 @@ class KHR_materials_pbrSpecularGlossiness(BaseGLTFDataClass):
         self.specular_glossiness_texture = specular_glossiness_texture
 
     def to_data(self, texture_index_by_key, **kwargs):
-        dct = {}
-        if self.diffuse_factor is not None:
-            dct["diffuseFactor"] = self.diffuse_factor
+        dct = self.fields_to_data()
         if self.diffuse_texture is not None:
             dct["diffuseTexture"] = self.diffuse_texture.to_data(texture_index_by_key)
-        if self.specular_factor is not None:
-            dct["specularFactor"] = self.specular_factor
-        if self.glossiness_factor is not None:
-            dct["glossinessFactor"] = self.glossiness_factor
         if self.specular_glossiness_texture is not None:
             dct["specularGlossinessTexture"] = self.specular_glossiness_texture.to_data(texture_index_by_key)
         if self.extras is not None:
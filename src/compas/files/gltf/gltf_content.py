@@ -155,23 +155,26 @@ class GLTFContent(object):
         # remove unvisited materials
         self._remove_unvisited(material_visit_log, self.materials)
 
-        # walk through existing materials and update textures visit log
-        def check_extensions_texture_recursively(item):
-            # get the extensions that are in the attributes
+        # walk through existing materials and their extensions and update textures visit log
+        stack = list(self.materials.values())
+        while stack:
+            item = stack.pop()
             for a in dir(item):
-                if not a.startswith("__") and not callable(getattr(item, a)):
-                    # ipy does not like this one: if isinstance(getattr(item, a), TextureInfoData):
-                    if getattr(getattr(item, a), "IS_TEXTURE_INFO_DATA", False):
-                        texture_visit_log[getattr(item, a).index] = True
-                    # ipy does not like this one: elif isinstance(getattr(item, a), BaseGLTFDataClass):
-                    elif getattr(getattr(item, a), "IS_BASE_GLTF_DATA", False):
-                        check_extensions_texture_recursively(getattr(item, a))
+                if a.startswith("__"):
+                    continue
+                value = getattr(item, a)
+                if callable(value):
+                    continue
+                # ipy does not like this one: if isinstance(value, TextureInfoData):
+                if getattr(value, "IS_TEXTURE_INFO_DATA", False):
+                    texture_visit_log[value.index] = True
+                # ipy does not like this one: elif isinstance(value, BaseGLTFDataClass):
+                elif getattr(value, "IS_BASE_GLTF_DATA", False):
+                    stack.append(value)
             if item.extensions is not None:
-                for _, e in item.extensions.items():
-                    check_extensions_texture_recursively(e)
-
-        for material in self.materials.values():
-            check_extensions_texture_recursively(material)
+                for e in item.extensions.values():
+                    if getattr(e, "IS_BASE_GLTF_DATA", False):
+                        stack.append(e)
 
         # remove unvisited textures
         self._remove_unvisited(texture_visit_log, self.textures)
@@ -498,9 +501,9 @@ if __name__ == "__main__":
 
     import compas
     from compas.datastructures import Mesh
+    from compas.files.gltf.constants import MIME_TYPE_PNG
     from compas.files.gltf.data_classes import ImageData
     from compas.files.gltf.data_classes import MaterialData
-    from compas.files.gltf.data_classes import MineType
     from compas.files.gltf.data_classes import PBRMetallicRoughnessData
     from compas.files.gltf.data_classes import TextureData
     from compas.files.gltf.extensions import KHR_materials_pbrSpecularGlossiness
@@ -530,7 +533,7 @@ if __name__ == "__main__":
     # and the gltf only makes sense when bundled with these external files.
     image_data = ImageData(
         name=image_uri,
-        mime_type=MineType.PNG,
+        mime_type=MIME_TYPE_PNG,
         uri=image_file,
     )
     image_idx = cnt.add_image(image_data)
@@ -343,32 +343,31 @@ class GLTFExporter(object):
         self._gltf_dict["nodes"] = node_list
 
     def _construct_primitives(self, mesh_data):
+        construct_accessor = self._construct_accessor
+        material_index_by_key = self._material_index_by_key
         primitives = []
         for primitive_data in mesh_data.primitive_data_list:
-            indices_accessor = self._construct_accessor(primitive_data.indices, COMPONENT_TYPE_UNSIGNED_SHORT, TYPE_SCALAR)
+            indices_accessor = construct_accessor(primitive_data.indices, COMPONENT_TYPE_UNSIGNED_SHORT, TYPE_SCALAR)
 
             attributes = {}
-            for attr in primitive_data.attributes:
+            for attr, data in primitive_data.attributes.items():
                 component_type = COMPONENT_TYPE_UNSIGNED_INT if attr.startswith("JOINT") else COMPONENT_TYPE_FLOAT
                 type_ = TYPE_VEC3
-                if len(primitive_data.attributes[attr][0]) == 4:
+                dimension = len(data[0])
+                if dimension == 4:
                     type_ = TYPE_VEC4
-                if len(primitive_data.attributes[attr][0]) == 2:
+                elif dimension == 2:
                     type_ = TYPE_VEC2
-                attributes[attr] = self._construct_accessor(primitive_data.attributes[attr], component_type, type_, True)
+                attributes[attr] = construct_accessor(data, component_type, type_, True)
 
             targets = []
             for target in primitive_data.targets or []:
                 target_dict = {}
-                for attr in target:
-                    component_type = COMPONENT_TYPE_FLOAT
-                    type_ = TYPE_VEC3
-                    target_dict[attr] = self._construct_accessor(target[attr], component_type, type_, True)
+                for attr, data in target.items():
+                    target_dict[attr] = construct_accessor(data, COMPONENT_TYPE_FLOAT, TYPE_VEC3, True)
                 targets.append(target_dict)
 
-            primitive_dict = primitive_data.to_data(indices_accessor, attributes, targets, self._material_index_by_key)
-
-            primitives.append(primitive_dict)
+            primitives.append(primitive_data.to_data(indices_accessor, attributes, targets, material_index_by_key))
         return primitives
 
     def _construct_accessor(self, data, component_type, type_, include_bounds=False):
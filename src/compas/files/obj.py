@@ -2,7 +2,6 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from collections import OrderedDict
 from collections import defaultdict
 
 import compas
@@ -384,7 +383,7 @@ class OBJReader(object):
     def _read_polygonal_geometry(self, name, data):
         # point
         if name == 'p':
-            self.points.append(int(data[0]) - 1)
+            self.points.append(self._vertex_index(data[0]))
             ref = 'p', len(self.points) - 1
             self.groups[self.group].append(ref)
             self.objects[self.object].append(ref)
@@ -392,7 +391,7 @@ class OBJReader(object):
         elif name == 'l':
             if len(data) < 2:
                 return
-            self.lines.append([int(i) - 1 for i in data])
+            self.lines.append([self._vertex_index(i) for i in data])
             ref = 'l', len(self.lines) - 1
             self.groups[self.group].append(ref)
             self.objects[self.object].append(ref)
@@ -403,13 +402,23 @@ class OBJReader(object):
             face = []
             for d in data:
                 parts = d.split('/')
-                i = int(parts[0]) - 1
+                i = self._vertex_index(parts[0])
                 face.append(i)
             self.faces.append(face)
             ref = 'f', len(self.faces) - 1
             self.groups[self.group].append(ref)
             self.objects[self.object].append(ref)
 
+    def _vertex_index(self, reference):
+        # vertex references are 1-based,
+        # negative references are relative to the end of the vertices read so far
+        index = int(reference)
+        if index > 0:
+            return index - 1
+        if index < 0 and -index <= len(self.vertices):
+            return len(self.vertices) + index
+        raise ValueError('Invalid vertex reference: {}'.format(reference))
+
     def _read_freeform_attribute(self, name, data):
         if name == 'deg':
             self.deg = [int(i) for i in data]
@@ -519,18 +528,21 @@ class OBJParser(object):
         None
 
         """
-        index_key = OrderedDict()
-        vertex = OrderedDict()
+        gkey_index = {}
+        index_index = []
+        vertices = []
 
-        for i, xyz in enumerate(iter(self.reader.vertices)):
+        for xyz in self.reader.vertices:
             key = geometric_key(xyz, self.precision)
-            index_key[i] = key
-            vertex[key] = xyz
-
-        key_index = {key: index for index, key in enumerate(vertex)}
-        index_index = {index: key_index[key] for index, key in iter(index_key.items())}
+            index = gkey_index.get(key)
+            if index is None:
+                index = gkey_index[key] = len(vertices)
+                vertices.append(xyz)
+            else:
+                vertices[index] = xyz
+            index_index.append(index)
 
-        self.vertices = [xyz for xyz in iter(vertex.values())]
+        self.vertices = vertices
         self.points = [index_index[index] for index in self.reader.points]
         self.lines = [[index_index[index] for index in line] for line in self.reader.lines if len(line) == 2]
         self.polylines = [[index_index[index] for index in line] for line in self.reader.lines if len(line) > 2]
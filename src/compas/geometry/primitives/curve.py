@@ -2,8 +2,6 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from math import factorial
-
 from compas.geometry.primitives import Primitive
 from compas.geometry.primitives import Point
 from compas.geometry.primitives import Vector
@@ -31,8 +29,20 @@ def binomial_coefficient(n, k):
     and in which `k` ranges from 0 to `n`, gives a triangular array known as
     Pascal's triangle.
 
+    Examples
+    --------
+    >>> binomial_coefficient(5, 2)
+    10
+
     """
-    return int(factorial(n) / float(factorial(k) * factorial(n - k)))
+    if k > n - k:
+        k = n - k
+    if k < 0:
+        return 0
+    c = 1
+    for i in range(k):
+        c = c * (n - i) // (i + 1)
+    return c
 
 
 def bernstein(n, k, t):
@@ -78,6 +88,15 @@ def bernstein(n, k, t):
     return binomial_coefficient(n, k) * t ** k * (1 - t) ** (n - k)
 
 
+def _casteljau(points, t):
+    # evaluate the Bezier curve with the given control point coordinates at t
+    # by repeated linear interpolation
+    s = 1 - t
+    for n in range(len(points) - 1, 0, -1):
+        points = [[s * a[0] + t * b[0], s * a[1] + t * b[1], s * a[2] + t * b[2]] for a, b in zip(points[:n], points[1:])]
+    return points[0]
+
+
 class Bezier(Primitive):
     """A Bezier curve is defined by control points and a degree.
 
@@ -118,7 +137,7 @@ class Bezier(Primitive):
     @property
     def data(self):
         """dict : The data dictionary that represents the curve."""
-        return {'points': [list(point) for point in self.points]}
+        return {'points': [[point.x, point.y, point.z] for point in self._points]}
 
     @data.setter
     def data(self, data):
@@ -162,7 +181,7 @@ class Bezier(Primitive):
 
     @property
     def degree(self):
-        return len(self.points) - 1
+        return len(self._points) - 1
 
     # ==========================================================================
     # constructors
@@ -185,8 +204,7 @@ class Bezier(Primitive):
         None
 
         """
-        for point in self.points:
-            point.transform(T)
+        Point.transform_collection(self._points, T)
 
     def point(self, t):
         """Compute a point on the curve.
@@ -210,12 +228,22 @@ class Bezier(Primitive):
         Point(1.000, 0.000, 0.000)
 
         """
-        n = self.degree
-        point = Point(0, 0, 0)
-        for i, p in enumerate(self.points):
-            b = bernstein(n, i, t)
-            point += p * b
-        return point
+        points = self._points
+        n = len(points) - 1
+        if n == 2:
+            s = 1 - t
+            weights = (s * s, 2 * s * t, t * t)
+        elif n == 3:
+            s = 1 - t
+            weights = (s * s * s, 3 * s * s * t, 3 * s * t * t, t * t * t)
+        else:
+            return Point(*_casteljau([[p.x, p.y, p.z] for p in points], t))
+        x, y, z = 0.0, 0.0, 0.0
+        for b, p in zip(weights, points):
+            x += p.x * b
+            y += p.y * b
+            z += p.z * b
+        return Point(x, y, z)
 
     def tangent(self, t):
         """Compute the tangent vector at a point on the curve.
@@ -237,13 +265,9 @@ class Bezier(Primitive):
         Vector(1.000, 0.000, 0.000)
 
         """
-        n = self.degree
-        v = Vector(0, 0, 0)
-        for i, p in enumerate(self.points):
-            a = bernstein(n - 1, i - 1, t)
-            b = bernstein(n - 1, i, t)
-            c = n * (a - b)
-            v += p * c
+        points = self._points
+        hodograph = [[b.x - a.x, b.y - a.y, b.z - a.z] for a, b in zip(points[:-1], points[1:])]
+        v = Vector(*_casteljau(hodograph, t))
         v.unitize()
         return v
 
@@ -272,9 +296,18 @@ class Bezier(Primitive):
         Point(1.000, 0.000, 0.000)
 
         """
+        n = len(self._points) - 1
+        terms = [(k, n - k, binomial_coefficient(n, k), p.x, p.y, p.z) for k, p in enumerate(self._points)]
         locus = []
         divisor = float(resolution - 1)
         for i in range(resolution):
             t = i / divisor
-            locus.append(self.point(t))
+            s = 1 - t
+            x, y, z = 0.0, 0.0, 0.0
+            for k, m, c, px, py, pz in terms:
+                b = c * t ** k * s ** m
+                x += px * b
+                y += py * b
+                z += pz * b
+            locus.append(Point(x, y, z))
         return locus
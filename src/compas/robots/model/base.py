@@ -65,6 +65,16 @@ class FrameProxy(ProxyObject):
     This class is internal and not intended to be referenced externally.
     """
 
+    # forwarded explicitly, so that reads skip the ``__getattr__`` fallback
+    # and assignments reach the proxied frame instead of shadowing its point
+    @property
+    def point(self):
+        return self._proxied_object.point
+
+    @point.setter
+    def point(self, point):
+        self._proxied_object.point = point
+
     def get_urdf_element(self):
         attributes = {
             'xyz': "{} {} {}".format(self.point.x, self.point.y, self.point.z),
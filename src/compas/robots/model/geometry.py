@@ -160,7 +160,7 @@ class MeshDescriptor(Data):
         attributes = {'filename': self.filename}
         # There is no need to record default values.  Usually these
         # coincide with some form of 0 and are filtered out with
-        # `attributes = dict(filter(lambda x: x[1], attributes.items()))`,
+        # `attributes = {key: value for key, value in attributes.items() if value}`,
         # but here we must be explicit.
         if self.scale != [1.0, 1.0, 1.0]:
             attributes['scale'] = "{} {} {}".format(*self.scale)
@@ -2,6 +2,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from math import sqrt
+
 from compas.data import Data
 from compas.files import URDFElement
 from compas.files import URDFParser
@@ -10,7 +12,6 @@ from compas.geometry import Rotation
 from compas.geometry import Transformation
 from compas.geometry import Translation
 from compas.geometry import Vector
-from compas.geometry import transform_vectors
 from compas.robots.model.base import FrameProxy
 from compas.robots.model.base import _attr_from_data
 from compas.robots.model.base import _attr_to_data
@@ -100,7 +101,7 @@ class Calibration(Data):
             'falling': self.falling,
             'reference_position': self.reference_position,
         }
-        attributes = dict(filter(lambda x: x[1], attributes.items()))
+        attributes = {key: value for key, value in attributes.items() if value}
         return URDFElement('calibration', attributes)
 
     @property
@@ -179,7 +180,7 @@ class Limit(Data):
             'lower': self.lower,
             'upper': self.upper,
         }
-        attributes = dict(filter(lambda x: x[1], attributes.items()))
+        attributes = {key: value for key, value in attributes.items() if value}
         attributes['effort'] = self.effort
         attributes['velocity'] = self.velocity
         attributes.update(self.attr)
@@ -277,7 +278,7 @@ class SafetyController(Data):
             'soft_lower_limit': self.soft_lower_limit,
             'soft_upper_limit': self.soft_upper_limit,
         }
-        attributes = dict(filter(lambda x: x[1], attributes.items()))
+        attributes = {key: value for key, value in attributes.items() if value}
         attributes['k_velocity'] = self.k_velocity
         return URDFElement('safety_controller', attributes)
 
@@ -324,13 +325,13 @@ class Axis(Data):
         # We are not using Vector here because we
         # cannot attach _urdf_source to it due to __slots__
         super(Axis, self).__init__()
-        xyz = _parse_floats(xyz)
-        xyz = Vector(*xyz)
-        if xyz.length != 0:
-            xyz.unitize()
-        self.x = xyz[0]
-        self.y = xyz[1]
-        self.z = xyz[2]
+        x, y, z = _parse_floats(xyz)
+        length = sqrt(x * x + y * y + z * z)
+        if length != 0:
+            x, y, z = x / length, y / length, z / length
+        self.x = x
+        self.y = y
+        self.z = z
         self.attr = kwargs
 
     def get_urdf_element(self):
@@ -368,11 +369,7 @@ class Axis(Data):
             The transformation used to transform the axis.
 
         """
-        xyz = transform_vectors(
-            [[self.x, self.y, self.z]], transformation.matrix)
-        self.x = xyz[0][0]
-        self.y = xyz[0][1]
-        self.z = xyz[0][2]
+        self.x, self.y, self.z = self._transformed_xyz(transformation)
 
     def transformed(self, transformation):
         """Return a transformed copy of the axis.
@@ -388,9 +385,19 @@ class Axis(Data):
             The transformed axis.
 
         """
-        xyz = transform_vectors(
-            [[self.x, self.y, self.z]], transformation.matrix)
-        return Vector(xyz[0][0], xyz[0][1], xyz[0][2])
+        return Vector(*self._transformed_xyz(transformation))
+
+    def _transformed_xyz(self, transformation):
+        # same as transform_vectors([[x, y, z]], matrix)[0], without the intermediate lists
+        m = transformation.matrix
+        x, y, z = self.x, self.y, self.z
+        u = m[0][0] * x + m[0][1] * y + m[0][2] * z
+        v = m[1][0] * x + m[1][1] * y + m[1][2] * z
+        w = m[2][0] * x + m[2][1] * y + m[2][2] * z
+        h = m[3][0] * x + m[3][1] * y + m[3][2] * z
+        if h:
+            return u / h, v / h, w / h
+        return u, v, w
 
     @property
     def vector(self):
@@ -470,14 +477,19 @@ class Joint(Data):
     SUPPORTED_TYPES = ('revolute', 'continuous', 'prismatic', 'fixed',
                        'floating', 'planar')
 
+    _TYPE_INDEX = {type_: index for index, type_ in enumerate(SUPPORTED_TYPES)}
+
+    # names of the calculate_*_transformation methods, indexed by joint type
+    _CALCULATE_TRANSFORMATION = tuple('calculate_%s_transformation' % type_ for type_ in SUPPORTED_TYPES)
+
     def __init__(self, name, type, parent, child, origin=None, axis=None,
                  calibration=None, dynamics=None, limit=None,
                  safety_controller=None, mimic=None, **kwargs):
 
         type_idx = type
 
-        if isinstance(type_idx, str) and type_idx in Joint.SUPPORTED_TYPES:
-            type_idx = Joint.SUPPORTED_TYPES.index(type_idx)
+        if isinstance(type_idx, str):
+            type_idx = Joint._TYPE_INDEX.get(type_idx, type_idx)
 
         if type_idx not in range(len(Joint.SUPPORTED_TYPES)):
             raise ValueError('Unsupported joint type: %s' % type)
@@ -499,8 +511,9 @@ class Joint(Data):
         self.position = 0
         # The following are world-relative frames representing the origin and the axis, which change with
         # the joint state, while `origin` and `axis` above are parent-relative and static.
-        self.current_origin = self.origin.copy()
-        self.current_axis = self.axis.copy()
+        # They are copied from `origin` and `axis` on first access, falling back to the defaults if these are unset.
+        self._current_origin = None
+        self._current_axis = None
 
     @property
     def origin(self):
@@ -512,12 +525,24 @@ class Joint(Data):
 
     @property
     def current_origin(self):
+        if self._current_origin is None:
+            self.current_origin = self.origin.copy() if self.origin else Frame.worldXY()
         return self._current_origin
 
     @current_origin.setter
     def current_origin(self, value):
         self._current_origin = FrameProxy.create_proxy(value)
 
+    @property
+    def current_axis(self):
+        if self._current_axis is None:
+            self._current_axis = self.axis.copy() if self.axis else Axis()
+        return self._current_axis
+
+    @current_axis.setter
+    def current_axis(self, value):
+        self._current_axis = value
+
     def get_urdf_element(self):
         attributes = {
             'name': self.name,
@@ -549,7 +574,10 @@ class Joint(Data):
     @data.setter
     def data(self, data):
         self.name = data['name']
-        self.type = Joint.SUPPORTED_TYPES.index(data['type'])
+        type_idx = Joint._TYPE_INDEX.get(data['type'])
+        if type_idx is None:
+            raise ValueError('Unsupported joint type: %s' % data['type'])
+        self.type = type_idx
         self.parent = ParentLink.from_data(data['parent'])
         self.child = ChildLink.from_data(data['child'])
         self.origin = Frame.from_data(data['origin']) if data['origin'] else None
@@ -630,7 +658,11 @@ class Joint(Data):
         if not self.limit:
             raise ValueError('Revolute joints are required to define a limit')
 
-        position = max(min(position, self.limit.upper), self.limit.lower)
+        limit = self.limit
+        if position > limit.upper:
+            position = limit.upper
+        if position < limit.lower:
+            position = limit.lower
         return self.calculate_continuous_transformation(position)
 
     def calculate_continuous_transformation(self, position):
@@ -650,7 +682,8 @@ class Joint(Data):
             Transformation of type rotation for the continuous joint.
 
         """
-        return Rotation.from_axis_and_angle(self.current_axis.vector, position, self.current_origin.point)
+        axis = self.current_axis
+        return Rotation.from_axis_and_angle([axis.x, axis.y, axis.z], position, self.current_origin.point)
 
     def calculate_prismatic_transformation(self, position):
         """Returns a transformation of a prismatic joint.
@@ -672,8 +705,13 @@ class Joint(Data):
         if not self.limit:
             raise ValueError('Prismatic joints are required to define a limit')
 
-        position = max(min(position, self.limit.upper), self.limit.lower)
-        return Translation.from_vector(self.current_axis.vector * position)
+        limit = self.limit
+        if position > limit.upper:
+            position = limit.upper
+        if position < limit.lower:
+            position = limit.lower
+        axis = self.current_axis
+        return Translation.from_vector([axis.x * position, axis.y * position, axis.z * position])
 
     # does this ever happen?
     def calculate_fixed_transformation(self, position):
@@ -714,20 +752,7 @@ class Joint(Data):
         position : float
             Position in radians or meters depending on the joint type.
         """
-
-        # Set the transformation function according to the type
-        if not hasattr(self, '_calculate_transformation'):
-            switcher = {
-                Joint.REVOLUTE: self.calculate_revolute_transformation,
-                Joint.CONTINUOUS: self.calculate_continuous_transformation,
-                Joint.PRISMATIC: self.calculate_prismatic_transformation,
-                Joint.FIXED: self.calculate_fixed_transformation,
-                Joint.FLOATING: self.calculate_floating_transformation,
-                Joint.PLANAR: self.calculate_planar_transformation
-            }
-            self._calculate_transformation = switcher.get(self.type)
-
-        return self._calculate_transformation(position)
+        return getattr(self, Joint._CALCULATE_TRANSFORMATION[self.type])(position)
 
     def is_configurable(self):
         """Returns ``True`` if the joint can be configured, otherwise ``False``."""
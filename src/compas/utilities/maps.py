@@ -48,15 +48,19 @@ def geometric_key(xyz, precision=None, sanitize=True):
         precision = compas.PRECISION
     if precision == 'd':
         return '{0},{1},{2}'.format(int(x), int(y), int(z))
+    tpl = '{0:.%s}' % precision
+    x = tpl.format(x)
+    y = tpl.format(y)
+    z = tpl.format(z)
     if sanitize:
-        minzero = "-{0:.{1}}".format(0.0, precision)
-        if "{0:.{1}}".format(x, precision) == minzero:
-            x = 0.0
-        if "{0:.{1}}".format(y, precision) == minzero:
-            y = 0.0
-        if "{0:.{1}}".format(z, precision) == minzero:
-            z = 0.0
-    return '{0:.{3}},{1:.{3}},{2:.{3}}'.format(x, y, z, precision)
+        minzero = '-' + tpl.format(0.0)
+        if x == minzero:
+            x = x[1:]
+        if y == minzero:
+            y = y[1:]
+        if z == minzero:
+            z = z[1:]
+    return x + ',' + y + ',' + z
 
 
 def reverse_geometric_key(gkey):
@@ -125,10 +129,13 @@ def geometric_key_xy(xy, precision=None, sanitize=True):
         precision = compas.PRECISION
     if precision == 'd':
         return '{0},{1}'.format(int(x), int(y))
+    tpl = '{0:.%s}' % precision
+    x = tpl.format(x)
+    y = tpl.format(y)
     if sanitize:
-        minzero = "-{0:.{1}}".format(0.0, precision)
-        if "{0:.{1}}".format(x, precision) == minzero:
-            x = 0.0
-        if "{0:.{1}}".format(y, precision) == minzero:
-            y = 0.0
-    return '{0:.{2}},{1:.{2}}'.format(x, y, precision)
+        minzero = '-' + tpl.format(0.0)
+        if x == minzero:
+            x = x[1:]
+        if y == minzero:
+            y = y[1:]
+    return x + ',' + y
@@ -94,6 +94,26 @@ def test_default_edge_attributes():
         assert graph.edge_attribute(edge, name='a') == 3
 
 
+def test_add_node_attributes():
+    graph = Graph()
+    attr = {'a': 1}
+    assert graph.add_node(attr_dict=attr, b=2) == 0
+    assert attr == {'a': 1}
+    graph.add_node(0, a=3)
+    assert graph.node[0] == {'a': 3, 'b': 2}
+
+
+def test_add_edge_attributes():
+    graph = Graph()
+    attr = {'a': 1}
+    graph.add_edge(0, 1, attr_dict=attr, b=2)
+    assert attr == {'a': 1}
+    graph.add_edge(0, 1, a=3)
+    assert graph.edge[0][1] == {'a': 3, 'b': 2}
+    assert list(graph.neighbors(0)) == [1]
+    assert list(graph.neighbors(1)) == [0]
+
+
 # ==============================================================================
 # Tests - Conversion
 # ==============================================================================
@@ -1,5 +1,7 @@
 import pytest
 
+import compas
+
 from compas.datastructures import Network
 
 
@@ -51,3 +53,94 @@ def test_planar(k5_network):
 
     k5_network.delete_edge('a', 'b')  # Delete (a, b) edge to make K5 planar
     assert network_is_planar(k5_network) is True
+
+
+def test_to_points_and_lines():
+    network = Network.from_nodes_and_edges([[0, 0, 0], [1, 0, 0], [1, 1, 0]], [(0, 1), (1, 2)])
+    assert network.to_points() == [[0, 0, 0], [1, 0, 0], [1, 1, 0]]
+    assert network.to_lines() == [([0, 0, 0], [1, 0, 0]), ([1, 0, 0], [1, 1, 0])]
+
+
+def test_from_lines():
+    lines = [([0.0, 0.0, 0.0], [1.0, 0.0, 0.0]), ([1.0, 0.0, 0.0], [1.0, 1.0, 0.0]), ([1.0, 1.0, 0.0], [0.0, 0.0, 0.0])]
+    network = Network.from_lines(lines)
+    assert network.number_of_nodes() == 3
+    assert network.number_of_edges() == 3
+    assert list(network.edges()) == [(0, 1), (1, 2), (2, 0)]
+    assert network.node_coordinates(2) == [1.0, 1.0, 0.0]
+
+
+def test_to_nodes_and_edges():
+    network = Network()
+    network.add_node('a', x=0.0, y=0.0, z=0.0)
+    network.add_node('b', x=1.0, y=0.0, z=0.0)
+    network.add_node('c', x=1.0, y=1.0, z=0.0)
+    network.add_edge('a', 'b')
+    network.add_edge('c', 'b')
+    nodes, edges = network.to_nodes_and_edges()
+    assert nodes == [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0]]
+    assert edges == [(0, 1), (2, 1)]
+
+
+def test_edge_coordinates():
+    network = Network.from_nodes_and_edges([[0, 0, 0], [1, 2, 3]], [(0, 1)])
+    assert network.edge_coordinates(0, 1) == ([0, 0, 0], [1, 2, 3])
+    assert network.edge_coordinates(0, 1, axes='zx') == ([0, 0], [3, 1])
+
+
+def test_edge_geometry_numpy():
+    if compas.IPY:
+        return
+
+    from compas.datastructures import network_edge_lengths_numpy
+    from compas.datastructures import network_edge_vectors_numpy
+    from compas.datastructures import network_edge_midpoints_numpy
+
+    network = Network.from_nodes_and_edges({'a': [0, 0, 0], 'b': [3, 4, 0], 'c': [3, 4, 12]}, [('a', 'b'), ('c', 'b')])
+    lengths = network_edge_lengths_numpy(network)
+    assert lengths.tolist() == [network.edge_length(u, v) for u, v in network.edges()]
+    assert network_edge_vectors_numpy(network).tolist() == [[3, 4, 0], [0, 0, -12]]
+    assert network_edge_midpoints_numpy(network).tolist() == [[1.5, 2, 0], [3, 4, 6]]
+
+
+def test_key_gkey():
+    network = Network.from_nodes_and_edges({'a': [0, 0, 0], 'b': [1.0, -0.0001, 0]}, [('a', 'b')])
+    assert network.key_gkey('3f') == {'a': '0.000,0.000,0.000', 'b': '1.000,0.000,0.000'}
+    assert network.gkey_key('1f') == {'0.0,0.0,0.0': 'a', '1.0,0.0,0.0': 'b'}
+    network.node_attribute('b', 'x', 2.0)
+    assert network.key_gkey('3f')['b'] == '2.000,0.000,0.000'
+
+
+def test_node_neighborhood_centroid_and_laplacian():
+    network = Network.from_nodes_and_edges([[0, 0, 0], [2, 0, 0], [0, 4, 0], [0, 0, 6]], [(0, 1), (0, 2), (0, 3)])
+    assert network.node_neighborhood_centroid(0) == [2 / 3, 4 / 3, 2.0]
+    assert network.node_laplacian(1) == [-2.0, 0.0, 0.0]
+
+
+def test_from_obj():
+    network = Network.from_obj(compas.get('lines.obj'))
+    assert network.number_of_nodes() == 32
+    assert network.number_of_edges() == 40
+
+
+def test_smooth():
+    network = Network.from_nodes_and_edges([[0, 0, 0], [1, 1, 0], [2, 0, 0]], [(0, 1), (1, 2)])
+    network.smooth(fixed=[0, 2], kmax=10, damping=1.0)
+    assert network.node_coordinates(1) == [1.0, 0.0, 0.0]
+    assert network.node_coordinates(0) == [0, 0, 0]
+
+
+def test_edge_length_and_direction():
+    network = Network.from_nodes_and_edges([[0, 0, 0], [3, 0, 4], [3, 0, 4]], [(0, 1), (1, 2)])
+    assert network.edge_length(0, 1) == 5.0
+    assert network.edge_direction(0, 1) == [0.6, 0.0, 0.8]
+    assert network.edge_length(1, 2) == 0.0
+    assert network.edge_direction(1, 2) == [0, 0, 0]
+
+
+def test_node_coordinates():
+    network = Network()
+    network.add_node(0, x=1.0, y=2.0, z=3.0)
+    assert network.node_coordinates(0) == [1.0, 2.0, 3.0]
+    assert network.node_coordinates(0, axes='xy') == [1.0, 2.0]
+    assert network.node_coordinates(0, axes='zyx') == [3.0, 2.0, 1.0]
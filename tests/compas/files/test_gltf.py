@@ -177,3 +177,117 @@ def test_gltf_content():
     assert len(node_0.children) == 0
     assert len(content.nodes) == 1
     assert len(scene.nodes) == 1
+
+
+def test_gltf_content_remove_orphan_textures():
+    from compas.datastructures import Mesh
+    from compas.files.gltf.data_classes import MaterialData
+    from compas.files.gltf.data_classes import PBRMetallicRoughnessData
+    from compas.files.gltf.data_classes import TextureData
+    from compas.files.gltf.data_classes import TextureInfoData
+    from compas.files.gltf.extensions import KHR_materials_clearcoat
+
+    content = GLTFContent()
+    scene = content.add_scene()
+    node = scene.add_child()
+    mesh_data = node.add_mesh(Mesh.from_vertices_and_faces([[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[0, 1, 2]]))
+
+    texture_0 = content.add_texture(TextureData())
+    texture_1 = content.add_texture(TextureData())
+    content.add_texture(TextureData())
+
+    material = MaterialData(pbr_metallic_roughness=PBRMetallicRoughnessData(base_color_texture=TextureInfoData(texture_0)))
+    material.add_extension(KHR_materials_clearcoat(clearcoat_texture=TextureInfoData(texture_1)))
+    material.extensions["EXT_unknown"] = {"value": 1}
+    mesh_data.primitive_data_list[0].material = content.add_material(material)
+
+    content.remove_orphans()
+    assert sorted(content.textures) == [texture_0, texture_1]
+
+
+@pytest.mark.parametrize("protocol", [0, 1, 2])
+def test_gltf_data_classes_pickle(protocol):
+    import pickle
+
+    from compas.files.gltf.data_classes import MaterialData
+    from compas.files.gltf.data_classes import NormalTextureInfoData
+
+    material = MaterialData(name="m", alpha_cutoff=0.5, extras={"a": 1})
+    material.normal_texture = NormalTextureInfoData(0, scale=2.0)
+    other = pickle.loads(pickle.dumps(material, protocol=protocol))
+    assert other.name == "m"
+    assert other.alpha_cutoff == 0.5
+    assert other.extras == {"a": 1}
+    assert other.extensions is None
+    assert other.normal_texture.index == 0
+    assert other.normal_texture.scale == 2.0
+
+
+def test_gltf_data_classes_to_data():
+    from compas.files.gltf.data_classes import CameraData
+    from compas.files.gltf.data_classes import MaterialData
+    from compas.files.gltf.data_classes import SamplerData
+    from compas.files.gltf.data_classes import TargetData
+
+    sampler = SamplerData(mag_filter=9729, wrap_s=33071, extras={"a": 1})
+    assert sampler.to_data() == {"magFilter": 9729, "wrapS": 33071, "extras": {"a": 1}}
+
+    camera = CameraData("perspective", perspective={"yfov": 1.0, "znear": 0.1})
+    assert camera.to_data() == {"type": "perspective", "perspective": {"yfov": 1.0, "znear": 0.1}}
+    assert CameraData(None).to_data() == {"type": None}
+    assert TargetData(None).to_data({}) == {"path": None}
+
+    data = {
+        "name": "material",
+        "pbrMetallicRoughness": {
+            "baseColorFactor": [1.0, 0.0, 0.0, 1.0],
+            "baseColorTexture": {"index": 0, "texCoord": 1},
+            "metallicFactor": 0.5,
+        },
+        "normalTexture": {"index": 1, "scale": 2.0},
+        "emissiveFactor": [0.0, 0.0, 0.0],
+        "alphaMode": "BLEND",
+        "doubleSided": True,
+        "extensions": {
+            "KHR_materials_clearcoat": {"clearcoatFactor": 1.0, "clearcoatNormalTexture": {"index": 1, "scale": 0.5}},
+            "KHR_materials_ior": {"ior": 1.4},
+            "KHR_materials_transmission": {"transmissionFactor": 0.2, "transmissionTexture": {"index": 0}},
+            "EXT_unknown": {"value": 1},
+        },
+    }
+    material = MaterialData.from_data(data)
+    assert material.to_data({0: 10, 1: 11}) == {
+        "name": "material",
+        "pbrMetallicRoughness": {
+            "baseColorFactor": [1.0, 0.0, 0.0, 1.0],
+            "baseColorTexture": {"index": 10, "texCoord": 1},
+            "metallicFactor": 0.5,
+        },
+        "normalTexture": {"index": 11, "scale": 2.0},
+        "emissiveFactor": [0.0, 0.0, 0.0],
+        "alphaMode": "BLEND",
+        "doubleSided": True,
+        "extensions": {
+            "KHR_materials_clearcoat": {"clearcoatFactor": 1.0, "clearcoatNormalTexture": {"index": 11, "scale": 0.5}},
+            "KHR_materials_ior": {"ior": 1.4},
+            "KHR_materials_transmission": {"transmissionFactor": 0.2, "transmissionTexture": {"index": 10}},
+            "EXT_unknown": {"value": 1},
+        },
+    }
+
+
+def test_gltf_skin_data_to_data():
+    from compas.files.gltf.data_classes import SkinData
+
+    skin = SkinData(["a", "missing", "b"], inverse_bind_matrices=[[1.0] * 16] * 2, name="skin")
+    assert skin.to_data({"a": 0, "b": 3}, 5) == {"name": "skin", "joints": [0, 3], "inverseBindMatrices": 5}
+
+    skin = SkinData(["a"], extensions={"EXT_unknown": {"value": 1}})
+    assert skin.to_data({"a": 0}, None) == {"joints": [0], "extensions": {"EXT_unknown": {"value": 1}}}
+
+
+def test_gltf_image_data_to_data():
+    from compas.files.gltf.data_classes import ImageData
+
+    image = ImageData(uri="image.png", name="image", extensions={"EXT_unknown": {"value": 1}})
+    assert image.to_data(None, None) == {"name": "image", "uri": "image.png", "extensions": {"EXT_unknown": {"value": 1}}}
@@ -0,0 +1,32 @@
+import pytest
+
+from compas.files import OBJ
+
+
+@pytest.fixture
+def obj_file(tmp_path):
+    def write(content):
+        filepath = tmp_path / 'test.obj'
+        filepath.write_text(content)
+        return str(filepath)
+    return write
+
+
+def test_duplicate_vertices(obj_file):
+    obj = OBJ(obj_file('v 0 0 0\nv 1 0 0\nv 1 1 0\nv 1 0 0\nf 1 2 3\nf 1 4 3\n'))
+    obj.read()
+    assert obj.vertices == [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0]]
+    assert obj.faces == [[0, 1, 2], [0, 1, 2]]
+
+
+def test_relative_face_index(obj_file):
+    obj = OBJ(obj_file('v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\nf -3 -2 -1\nf 1 -3 -1\n'))
+    obj.read()
+    assert obj.faces == [[1, 2, 3], [0, 1, 3]]
+
+
+@pytest.mark.parametrize('face', ['f 0 1 2', 'f -5 -2 -1'])
+def test_invalid_face_index(obj_file, face):
+    obj = OBJ(obj_file('v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\n' + face + '\n'))
+    with pytest.raises(ValueError):
+        obj.read()
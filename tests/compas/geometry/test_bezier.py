@@ -0,0 +1,58 @@
+from math import factorial
+
+import pytest
+
+from compas.geometry import Bezier
+from compas.geometry import allclose
+from compas.geometry.primitives.curve import binomial_coefficient
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 7, 30])
+def test_binomial_coefficient(n):
+    for k in range(n + 1):
+        assert binomial_coefficient(n, k) == factorial(n) // (factorial(k) * factorial(n - k))
+    assert binomial_coefficient(n, -1) == 0
+    assert binomial_coefficient(n, n + 1) == 0
+
+
+def test_bezier_point():
+    curve = Bezier([[0.0, 0.0, 0.0], [1.0, 2.0, 0.0], [2.0, 2.0, 1.0], [3.0, 0.0, 0.0]])
+    assert allclose(curve.point(0.0), [0.0, 0.0, 0.0])
+    assert allclose(curve.point(0.5), [1.5, 1.5, 0.375])
+    assert allclose(curve.point(1.0), [3.0, 0.0, 0.0])
+
+
+def test_bezier_tangent():
+    curve = Bezier([[0.0, 0.0, 0.0], [1.0, 2.0, 0.0], [2.0, 2.0, 1.0], [3.0, 0.0, 0.0]])
+    assert allclose(curve.tangent(0.0), [1 / 5 ** 0.5, 2 / 5 ** 0.5, 0.0])
+    assert allclose(curve.tangent(0.5), [4 / 17 ** 0.5, 0.0, 1 / 17 ** 0.5])
+
+
+@pytest.mark.parametrize("degree", [1, 2, 3, 4, 5])
+def test_bezier_locus(degree):
+    points = [[i, (-1) ** i * i, i * i] for i in range(degree + 1)]
+    curve = Bezier(points)
+    locus = curve.locus(11)
+    assert len(locus) == 11
+    for i, point in enumerate(locus):
+        assert allclose(point, curve.point(i / 10.0))
+    assert allclose(locus[0], points[0])
+    assert allclose(locus[-1], points[-1])
+
+
+def test_bezier_data():
+    curve = Bezier([[0.0, 0.0, 0.0], [0.5, 1.0], [1.0, 0.0, 0.0]])
+    assert curve.data == {"points": [[0.0, 0.0, 0.0], [0.5, 1.0, 0.0], [1.0, 0.0, 0.0]]}
+    other = Bezier.from_data(curve.data)
+    assert other.data == curve.data
+    assert other.points[1] is not curve.points[1]
+
+
+def test_bezier_transform():
+    from compas.geometry import Translation
+
+    curve = Bezier([[0.0, 0.0, 0.0], [0.5, 1.0, 0.0], [1.0, 0.0, 0.0]])
+    points = curve.points
+    curve.transform(Translation.from_vector([1.0, 2.0, 3.0]))
+    assert curve.points[0] is points[0]
+    assert curve.data == {"points": [[1.0, 2.0, 3.0], [1.5, 3.0, 3.0], [2.0, 2.0, 3.0]]}
@@ -49,6 +49,69 @@ def test_prismatic_calculate_transformation():
     assert t == Translation.from_vector([550, 0, 0])
 
 
+def test_calculate_transformation_clamps_to_limit():
+    limit = Limit(lower=-10, upper=1000)
+    j1 = Joint('j1', 'prismatic', None, None, axis=Axis('1 0 0'), limit=limit)
+    assert j1.calculate_transformation(1500) == Translation.from_vector([1000, 0, 0])
+    assert j1.calculate_transformation(-20) == Translation.from_vector([-10, 0, 0])
+
+
+def test_calculate_transformation_follows_type():
+    limit = Limit(lower=0, upper=1000)
+    j1 = Joint('j1', 'prismatic', None, None, axis=Axis('1 0 0'), limit=limit)
+    assert j1.calculate_transformation(550) == Translation.from_vector([550, 0, 0])
+    j1.type = Joint.FIXED
+    assert j1.calculate_transformation(550) == Transformation()
+
+
+def test_axis_transform():
+    from compas.geometry import Rotation
+    from compas.geometry import allclose
+
+    T = Translation.from_vector([1, 2, 3]) * Rotation.from_axis_and_angle([0, 0, 1], pi / 2)
+    axis = Axis('1 0 0')
+    assert allclose(axis.transformed(T), [0, 1, 0])
+    axis.transform(T)
+    assert allclose([axis.x, axis.y, axis.z], [0, 1, 0])
+
+
+def test_scale_and_transform_origin():
+    from compas.geometry import Frame
+    from compas.geometry import allclose
+
+    j1 = Joint('j1', 'fixed', None, None, origin=Frame([1, 0, 0], [1, 0, 0], [0, 1, 0]))
+    j1.scale(10)
+    j1.transform(Translation.from_vector([1, 0, 0]))
+    assert allclose(j1.current_origin.point, [11, 0, 0])
+    assert allclose(j1.current_transformation.translation_vector, [11, 0, 0])
+
+
+def test_current_origin_and_axis_from_data():
+    from compas.geometry import Frame
+    from compas.geometry import allclose
+
+    j1 = Joint('j1', 'revolute', 'a', 'b', origin=Frame([1, 2, 3], [0, 1, 0], [-1, 0, 0]), axis=Axis('0 0 1'))
+    j2 = Joint.from_data(j1.data)
+    assert allclose(j2.current_origin.point, [1, 2, 3])
+    assert allclose(j2.current_origin.xaxis, [0, 1, 0])
+    assert allclose(j2.current_axis.vector, [0, 0, 1])
+    assert j2.current_origin is not j2.origin
+    assert j2.current_axis is not j2.axis
+
+
+def test_current_origin_and_axis_without_origin_and_axis():
+    from compas.geometry import allclose
+
+    data = Joint('j1', 'revolute', 'a', 'b').data
+    data['origin'] = None
+    data['axis'] = None
+    j1 = Joint.from_data(data)
+    assert allclose(j1.current_origin.point, [0, 0, 0])
+    assert allclose(j1.current_origin.xaxis, [1, 0, 0])
+    assert allclose(j1.current_axis.vector, [1, 0, 0])
+    assert allclose(j1.current_transformation.translation_vector, [0, 0, 0])
+
+
 def test_mimic_calculate_position():
     multiplier = 5.0
     offset = 100.
@@ -57,3 +120,11 @@ def test_mimic_calculate_position():
     mimic = Mimic(j1, multiplier=multiplier, offset=offset)
     result = mimic.calculate_position(j1.position)
     assert result == multiplier * j1.position + offset
+
+
+def test_data_unsupported_type():
+    j1 = Joint('j1', 'revolute', 'a', 'b')
+    data = j1.data
+    data['type'] = 'helical'
+    with pytest.raises(ValueError):
+        j1.data = data